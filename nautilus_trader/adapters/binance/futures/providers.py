@@ -14,7 +14,7 @@
 # -------------------------------------------------------------------------------------------------
 
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from nautilus_trader.adapters.binance.common.constants import BINANCE_VENUE
 from nautilus_trader.adapters.binance.common.enums import BinanceAccountType
@@ -35,6 +35,9 @@ from nautilus_trader.core.datetime import millis_to_nanos
 from nautilus_trader.model.identifiers import InstrumentId
 
 
+_EXCHANGE_INFO_TTL_SECS: float = 60.0
+
+
 class BinanceFuturesInstrumentProvider(InstrumentProvider):
     """
     Provides a means of loading instruments from the `Binance Futures` exchange.
@@ -68,17 +71,45 @@ class BinanceFuturesInstrumentProvider(InstrumentProvider):
         self._http_wallet = BinanceFuturesWalletHttpAPI(self._client)
         self._http_market = BinanceFuturesMarketHttpAPI(self._client, account_type=account_type)
 
+        # Cached exchange info responses keyed by requested symbol(s)
+        self._exchange_info_cache: Dict[Any, Tuple[float, BinanceFuturesExchangeInfo]] = {}
+
+    async def _get_exchange_info(
+        self,
+        symbol: Optional[str] = None,
+        symbols: Optional[List[str]] = None,
+    ) -> BinanceFuturesExchangeInfo:
+        # The exchange info only changes on Binance's schedule, so responses
+        # are cached for a short TTL to avoid repeated round-trips when several
+        # load calls are triggered during start up.
+        key = symbol if symbols is None else tuple(symbols)
+        cached = self._exchange_info_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _EXCHANGE_INFO_TTL_SECS:
+            return cached[1]
+
+        if symbol is not None:
+            exchange_info = await self._http_market.exchange_info(symbol=symbol)
+        elif symbols is not None:
+            exchange_info = await self._http_market.exchange_info(symbols=symbols)
+        else:
+            exchange_info = await self._http_market.exchange_info()
+        self._exchange_info_cache[key] = (time.monotonic(), exchange_info)
+        return exchange_info
+
     async def load_all_async(self, filters: Optional[Dict] = None) -> None:
         filters_str = "..." if not filters else f" with filters {filters}..."
         self._log.info(f"Loading all instruments{filters_str}")
 
         # Get exchange info for all assets
-        exchange_info: BinanceFuturesExchangeInfo = await self._http_market.exchange_info()
+        exchange_info: BinanceFuturesExchangeInfo = await self._get_exchange_info()
+        ts_init = time.time_ns()
+        ts_event = millis_to_nanos(exchange_info.serverTime)
         for symbol_info in exchange_info.symbols:
             self._parse_instrument(
                 symbol_info=symbol_info,
                 fees=None,
-                ts_event=millis_to_nanos(exchange_info.serverTime),
+                ts_event=ts_event,
+                ts_init=ts_init,
             )
 
     async def load_ids_async(
@@ -101,14 +132,15 @@ class BinanceFuturesInstrumentProvider(InstrumentProvider):
         symbols: List[str] = [instrument_id.symbol.value for instrument_id in instrument_ids]
 
         # Get exchange info for all assets
-        exchange_info: BinanceFuturesExchangeInfo = await self._http_market.exchange_info(
-            symbols=symbols
-        )
+        exchange_info: BinanceFuturesExchangeInfo = await self._get_exchange_info(symbols=symbols)
+        ts_init = time.time_ns()
+        ts_event = millis_to_nanos(exchange_info.serverTime)
         for symbol_info in exchange_info.symbols:
             self._parse_instrument(
                 symbol_info=symbol_info,
                 fees=None,
-                ts_event=millis_to_nanos(exchange_info.serverTime),
+                ts_event=ts_event,
+                ts_init=ts_init,
             )
 
     async def load_async(self, instrument_id: InstrumentId, filters: Optional[Dict] = None) -> None:
@@ -121,14 +153,15 @@ class BinanceFuturesInstrumentProvider(InstrumentProvider):
         symbol = instrument_id.symbol.value
 
         # Get exchange info for all assets
-        exchange_info: BinanceFuturesExchangeInfo = await self._http_market.exchange_info(
-            symbol=symbol
-        )
+        exchange_info: BinanceFuturesExchangeInfo = await self._get_exchange_info(symbol=symbol)
+        ts_init = time.time_ns()
+        ts_event = millis_to_nanos(exchange_info.serverTime)
         for symbol_info in exchange_info.symbols:
             self._parse_instrument(
                 symbol_info=symbol_info,
                 fees=None,
-                ts_event=millis_to_nanos(exchange_info.serverTime),
+                ts_event=ts_event,
+                ts_init=ts_init,
             )
 
     def _parse_instrument(
@@ -136,6 +169,7 @@ class BinanceFuturesInstrumentProvider(InstrumentProvider):
         symbol_info: BinanceFuturesSymbolInfo,
         fees: Optional[Dict[str, Any]],
         ts_event: int,
+        ts_init: int,
     ) -> None:
         contract_type_str = symbol_info.contractType
 
@@ -150,7 +184,7 @@ class BinanceFuturesInstrumentProvider(InstrumentProvider):
             instrument = parse_perpetual_instrument_http(
                 symbol_info=symbol_info,
                 ts_event=ts_event,
-                ts_init=time.time_ns(),
+                ts_init=ts_init,
             )
             self.add_currency(currency=instrument.base_currency)
         elif contract_type in (
@@ -162,7 +196,7 @@ class BinanceFuturesInstrumentProvider(InstrumentProvider):
             instrument = parse_futures_instrument_http(
                 symbol_info=symbol_info,
                 ts_event=ts_event,
-                ts_init=time.time_ns(),
+                ts_init=ts_init,
             )
             self.add_currency(currency=instrument.underlying)
         else:  # pragma: no cover (design-time error)
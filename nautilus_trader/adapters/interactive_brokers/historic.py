@@ -13,10 +13,16 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import asyncio
 import datetime
+import functools
 import logging
-from typing import Dict, List, Literal, Union
+import operator
+import re
+from collections import namedtuple
+from typing import Dict, List, Literal, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import pytz
 from ib_insync import IB
@@ -26,9 +32,7 @@ from ib_insync import Contract
 from ib_insync import HistoricalTickBidAsk
 from ib_insync import HistoricalTickLast
 
-from nautilus_trader.adapters.interactive_brokers.parsing.data import generate_trade_id
 from nautilus_trader.adapters.interactive_brokers.parsing.instruments import parse_instrument
-from nautilus_trader.core.datetime import dt_to_unix_nanos
 from nautilus_trader.model.c_enums.bar_aggregation import BarAggregationParser
 from nautilus_trader.model.c_enums.price_type import PriceTypeParser
 from nautilus_trader.model.data.bar import Bar
@@ -39,6 +43,7 @@ from nautilus_trader.model.data.tick import TradeTick
 from nautilus_trader.model.enums import AggregationSource
 from nautilus_trader.model.enums import AggressorSide
 from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.identifiers import TradeId
 from nautilus_trader.model.instruments.base import Instrument
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
@@ -49,14 +54,169 @@ from nautilus_trader.persistence.external.core import write_objects
 logger = logging.getLogger(__name__)
 
 
+# Lightweight intermediate records holding only the fields consumed downstream;
+# the raw ib_insync objects carry per-instance dict overhead plus several
+# unused attributes, which adds up over a full day's accumulation.
+_HistoricalTradeTick = namedtuple("_HistoricalTradeTick", ("time", "price", "size"))
+_HistoricalBidAsk = namedtuple(
+    "_HistoricalBidAsk", ("time", "priceBid", "priceAsk", "sizeBid", "sizeAsk")
+)
+_HistoricalBar = namedtuple("_HistoricalBar", ("date", "open", "high", "low", "close", "volume"))
+
+
+def generate_directory(
+    catalog: ParquetDataCatalog,
+    instrument_id: InstrumentId,
+    kind: Literal["BID_ASK", "TRADES"],
+) -> str:
+    fn_kind = {"BID_ASK": "quote_tick", "TRADES": "trade_tick", "BARS": "bars"}[kind.split("-")[0]]
+    return f"{catalog.path}/data/{fn_kind}.parquet/instrument_id={instrument_id.value}"
+
+
 def generate_filename(
     catalog: ParquetDataCatalog,
     instrument_id: InstrumentId,
     kind: Literal["BID_ASK", "TRADES"],
     date: datetime.date,
 ) -> str:
-    fn_kind = {"BID_ASK": "quote_tick", "TRADES": "trade_tick", "BARS": "bars"}[kind.split("-")[0]]
-    return f"{catalog.path}/data/{fn_kind}.parquet/instrument_id={instrument_id.value}/{date:%Y%m%d}-0.parquet"
+    return f"{generate_directory(catalog, instrument_id, kind)}/{date:%Y%m%d}-0.parquet"
+
+
+def _existing_filenames(
+    catalog: ParquetDataCatalog,
+    instrument_id: InstrumentId,
+    kind: str,
+) -> set:
+    directory = generate_directory(catalog, instrument_id=instrument_id, kind=kind)
+    try:
+        return {fn.rsplit("/", maxsplit=1)[-1] for fn in catalog.fs.ls(directory)}
+    except FileNotFoundError:
+        return set()
+
+
+_FILENAME_RE = re.compile(r"^(\d{8})(?:-(\d{8}))?-\d+(?:-\d+)?\.parquet$")
+
+
+def _covered_dates(filenames) -> set:
+    """
+    Return the dates covered by existing catalog files named either per-day
+    (`20200101-0.parquet`) or per date range (`20200101-20200105-0.parquet`),
+    with an optional part number for sliced writes (`20200101-1-0.parquet`).
+    """
+    dates: set = set()
+    for fn in filenames:
+        match = _FILENAME_RE.match(fn)
+        if match is None:
+            continue
+        start = datetime.datetime.strptime(match.group(1), "%Y%m%d").date()
+        if match.group(2):
+            end = datetime.datetime.strptime(match.group(2), "%Y%m%d").date()
+        else:
+            end = start
+        dates.update(ts.date() for ts in pd.date_range(start, end))
+    return dates
+
+
+def _write_buffer(catalog: ParquetDataCatalog, buffer: Dict, batch_size: int):
+    first, last = buffer["dates"][0], buffer["dates"][-1]
+    if first == last:
+        prefix = f"{first:%Y%m%d}"
+    else:
+        prefix = f"{first:%Y%m%d}-{last:%Y%m%d}"
+
+    # Serialize in bounded slices rather than one giant write; the dataframe
+    # and arrow table built inside `write_objects` otherwise coexist with the
+    # full buffer and spike peak memory on liquid days. Each slice gets its
+    # own part-numbered file under the shared date(-range) prefix.
+    chunk = buffer["chunk"]
+    for part, start in enumerate(range(0, len(chunk), batch_size)):
+        template = f"{prefix}-{part}" + "-{i}.parquet"
+        write_objects(
+            catalog=catalog,
+            chunk=chunk[start : start + batch_size],
+            basename_template=template,
+        )
+
+
+def _next_business_day(date: datetime.date) -> datetime.date:
+    return (pd.Timestamp(date) + pd.offsets.BDay()).date()
+
+
+def _buffer_data(
+    catalog: ParquetDataCatalog,
+    buffers: Dict[tuple, Dict],
+    key: tuple,
+    date: datetime.date,
+    data: List,
+    write_batch_size: int,
+):
+    buffer = buffers.get(key)
+    if buffer is not None and date != _next_business_day(buffer["dates"][-1]):
+        # A gap means an intervening day returned no rows; flush so that range
+        # file names only ever span consecutive days that actually contributed
+        # data, keeping the empty day refetchable by a later back fill.
+        _write_buffer(catalog=catalog, buffer=buffers.pop(key), batch_size=write_batch_size)
+        buffer = None
+    if buffer is None:
+        buffer = buffers.setdefault(key, {"chunk": [], "dates": []})
+    buffer["chunk"].extend(data)
+    buffer["dates"].append(date)
+    if len(buffer["chunk"]) >= write_batch_size:
+        _write_buffer(catalog=catalog, buffer=buffers.pop(key), batch_size=write_batch_size)
+
+
+def _write_missing_instruments(catalog: ParquetDataCatalog, instruments: List[Instrument]):
+    # Check which instruments exist in the catalog (single query), write any missing.
+    existing_ids = {
+        instrument.id.value
+        for instrument in catalog.instruments(
+            instrument_ids=[instrument.id.value for instrument in instruments],
+            as_nautilus=True,
+        )
+    }
+    missing = [instrument for instrument in instruments if instrument.id.value not in existing_ids]
+    if missing:
+        write_objects(catalog=catalog, chunk=missing)
+
+
+def _build_work(
+    catalog: ParquetDataCatalog,
+    contracts: List[Contract],
+    instruments: List[Instrument],
+    start_date: datetime.date,
+    end_date: datetime.date,
+    tz_name: str,
+    kinds,
+) -> List[tuple]:
+    # One directory listing per (instrument, kind) instead of an `exists` call
+    # per (date, instrument, kind); the catalog contents don't change under us.
+    existing_dates = {
+        (instrument.id.value, kind): _covered_dates(
+            _existing_filenames(catalog, instrument.id, kind)
+        )
+        for instrument in instruments
+        for kind in kinds
+    }
+
+    # Convert the business-day range to python dates and log strings once,
+    # rather than per (instrument, kind) in the loops below.
+    dates = pd.bdate_range(start_date, end_date, tz=tz_name)
+    py_dates = [ts.date() for ts in dates]
+    date_strs = dates.strftime("%Y-%m-%d")
+
+    # Build the full list of work items up front, skipping any (date, contract,
+    # kind) already covered by a file in the catalog.
+    work = []
+    for date, date_str in zip(py_dates, date_strs):
+        for contract, instrument in zip(contracts, instruments):
+            for kind in kinds:
+                if date in existing_dates[(instrument.id.value, kind)]:
+                    logger.info(
+                        f"file for {instrument.id.value} {kind} {date_str} exists, skipping"
+                    )
+                    continue
+                work.append((contract, instrument, date, date_str, kind))
+    return work
 
 
 def back_fill_catalog(
@@ -67,6 +227,7 @@ def back_fill_catalog(
     end_date: datetime.date,
     tz_name: str,
     kinds=("BID_ASK", "TRADES"),
+    write_batch_size: int = 8192,
 ):
     """
     Back fill the data catalog with market data from Interactive Brokers.
@@ -90,38 +251,145 @@ def back_fill_catalog(
         - BID_ASK
         - TRADES
         - A bar specification, i.e. BARS-1-MINUTE-LAST or BARS-5-SECOND-MID
+    write_batch_size : int (default: 8192)
+        The minimum number of rows to accumulate per (instrument, kind) before
+        flushing a parquet file; consecutive days are batched into one write.
     """
-    for date in pd.bdate_range(start_date, end_date, tz=tz_name):
-        for contract in contracts:
-            [details] = ib.reqContractDetails(contract=contract)
-            instrument = parse_instrument(contract_details=details)
+    # Resolve the instrument for each contract once up front; the contract
+    # details don't change per date.
+    instruments: List[Instrument] = []
+    for contract in contracts:
+        [details] = ib.reqContractDetails(contract=contract)
+        instruments.append(parse_instrument(contract_details=details))
+    _write_missing_instruments(catalog=catalog, instruments=instruments)
+
+    work = _build_work(catalog, contracts, instruments, start_date, end_date, tz_name, kinds)
+
+    # The fetches are serialized through the single `ib` session (which is bound
+    # to one event loop and not thread-safe), as are the parquet writes below.
+    # Data is buffered per (instrument, kind) across consecutive days and
+    # flushed once `write_batch_size` rows accumulate; many tiny per-day
+    # parquet files are pathologically slow to both write and later query.
+    buffers: Dict[tuple, Dict] = {}
+    for contract, instrument, date, date_str, kind in work:
+        logger.info(f"Fetching {instrument.id.value} {kind} for {date_str}")
+
+        data = request_data(
+            contract=contract,
+            instrument=instrument,
+            date=date,
+            kind=kind,
+            tz_name=tz_name,
+            ib=ib,
+        )
+        if data is None:
+            continue
+        _buffer_data(catalog, buffers, (instrument.id.value, kind), date, data, write_batch_size)
 
-            # Check if this instrument exists in the catalog, if not, write it.
-            if not catalog.instruments(instrument_ids=[instrument.id.value], as_nautilus=True):
-                write_objects(catalog=catalog, chunk=[instrument])
+    for buffer in buffers.values():
+        _write_buffer(catalog=catalog, buffer=buffer, batch_size=write_batch_size)
 
-            for kind in kinds:
-                fn = generate_filename(catalog, instrument_id=instrument.id, kind=kind, date=date)
-                if catalog.fs.exists(fn):
-                    logger.info(
-                        f"file for {instrument.id.value} {kind} {date:%Y-%m-%d} exists, skipping"
-                    )
-                    continue
-                logger.info(f"Fetching {instrument.id.value} {kind} for {date:%Y-%m-%d}")
-
-                data = request_data(
-                    contract=contract,
-                    instrument=instrument,
-                    date=date.date(),
-                    kind=kind,
-                    tz_name=tz_name,
-                    ib=ib,
-                )
-                if data is None:
-                    continue
 
-                template = f"{date:%Y%m%d}" + "-{i}.parquet"
-                write_objects(catalog=catalog, chunk=data, basename_template=template)
+async def back_fill_catalog_async(
+    ib: IB,
+    catalog: ParquetDataCatalog,
+    contracts: List[Contract],
+    start_date: datetime.date,
+    end_date: datetime.date,
+    tz_name: str,
+    kinds=("BID_ASK", "TRADES"),
+    write_batch_size: int = 8192,
+    concurrency: int = 10,
+):
+    """
+    Back fill the data catalog with market data from Interactive Brokers,
+    fetching up to `concurrency` (contract, date, kind) items at a time.
+
+    Parameters are as for `back_fill_catalog`, with the addition of:
+
+    concurrency : int (default: 10)
+        The maximum number of in-flight historical data requests.
+    """
+    instruments: List[Instrument] = []
+    for contract in contracts:
+        [details] = await ib.reqContractDetailsAsync(contract=contract)
+        instruments.append(parse_instrument(contract_details=details))
+    _write_missing_instruments(catalog=catalog, instruments=instruments)
+
+    work = _build_work(catalog, contracts, instruments, start_date, end_date, tz_name, kinds)
+
+    async def fetch(contract, instrument, date, date_str, kind):
+        logger.info(f"Fetching {instrument.id.value} {kind} for {date_str}")
+        return await request_data_async(
+            contract=contract,
+            instrument=instrument,
+            date=date,
+            kind=kind,
+            tz_name=tz_name,
+            ib=ib,
+        )
+
+    # Fetch `concurrency` work items at a time (bounding both the in-flight
+    # requests and the retained results - IB throttles historical data anyway)
+    # and buffer each slice before fetching the next, so peak memory stays at
+    # roughly `write_batch_size` rows per key plus one slice of days, as in
+    # the synchronous version. The slices preserve work order, keeping the
+    # per-key date batching and range naming intact.
+    buffers: Dict[tuple, Dict] = {}
+    for start in range(0, len(work), concurrency):
+        batch = work[start : start + concurrency]
+        results = await asyncio.gather(*[fetch(*item) for item in batch])
+
+        # The parquet writes remain serialized on the calling task, buffered
+        # per (instrument, kind) exactly as in the synchronous version.
+        for (contract, instrument, date, date_str, kind), data in zip(batch, results):
+            if data is None:
+                continue
+            _buffer_data(
+                catalog, buffers, (instrument.id.value, kind), date, data, write_batch_size
+            )
+
+    for buffer in buffers.values():
+        _write_buffer(catalog=catalog, buffer=buffer, batch_size=write_batch_size)
+
+
+_BAR_KIND_RE = re.compile(r"^BARS-(\d+-\w+-\w+)$")
+
+
+@functools.lru_cache(maxsize=64)
+def parse_kind(kind: str) -> Tuple[str, Optional[BarSpecification]]:
+    """
+    Parse a data `kind` string into its tag and (optional) bar specification.
+
+    The result is memoized; a back fill re-parses the same few kinds for every
+    (date, instrument) pair.
+    """
+    if kind in ("TRADES", "BID_ASK"):
+        return kind, None
+    match = _BAR_KIND_RE.match(kind)
+    if match is None:
+        raise RuntimeError(f"Unknown {kind=}")
+    return "BARS", BarSpecification.from_str(match.group(1))
+
+
+def _parse_raw_data(
+    raw: List,
+    tag: str,
+    kind: str,
+    contract: Contract,
+    instrument: Instrument,
+    date: datetime.date,
+):
+    if not raw:
+        logging.info(f"No ticks for {date=} {kind=} {contract=}, skipping")
+        return
+    logger.info(f"Fetched {len(raw)} raw {kind}")
+    if tag == "TRADES":
+        return parse_historic_trade_ticks(historic_ticks=raw, instrument_id=instrument.id)
+    elif tag == "BID_ASK":
+        return parse_historic_quote_ticks(historic_ticks=raw, instrument_id=instrument.id)
+    else:  # BARS
+        return parse_historic_bars(historic_bars=raw, instrument=instrument, kind=kind)
 
 
 def request_data(
@@ -132,28 +400,76 @@ def request_data(
     tz_name: str,
     ib: IB = None,
 ):
-    if kind in ("TRADES", "BID_ASK"):
-        raw = request_tick_data(contract=contract, date=date, kind=kind, tz_name=tz_name, ib=ib)
-    elif kind.split("-")[0] == "BARS":
-        bar_spec = BarSpecification.from_str(kind.split("-", maxsplit=1)[1])
+    tag, bar_spec = parse_kind(kind)
+    if tag in ("TRADES", "BID_ASK"):
+        raw = request_tick_data(contract=contract, date=date, kind=tag, tz_name=tz_name, ib=ib)
+    else:  # BARS
         raw = request_bar_data(
             contract=contract, date=date, bar_spec=bar_spec, tz_name=tz_name, ib=ib
         )
-    else:
-        raise RuntimeError(f"Unknown {kind=}")
+    return _parse_raw_data(
+        raw=raw, tag=tag, kind=kind, contract=contract, instrument=instrument, date=date
+    )
 
-    if not raw:
-        logging.info(f"No ticks for {date=} {kind=} {contract=}, skipping")
-        return
-    logger.info(f"Fetched {len(raw)} raw {kind}")
+
+async def request_data_async(
+    contract: Contract,
+    instrument: Instrument,
+    date: datetime.date,
+    kind: str,
+    tz_name: str,
+    ib: IB = None,
+):
+    tag, bar_spec = parse_kind(kind)
+    if tag in ("TRADES", "BID_ASK"):
+        raw = await request_tick_data_async(
+            contract=contract, date=date, kind=tag, tz_name=tz_name, ib=ib
+        )
+    else:  # BARS
+        raw = await request_bar_data_async(
+            contract=contract, date=date, bar_spec=bar_spec, tz_name=tz_name, ib=ib
+        )
+    return _parse_raw_data(
+        raw=raw, tag=tag, kind=kind, contract=contract, instrument=instrument, date=date
+    )
+
+
+def _tick_record(kind: str) -> Tuple:
+    # Each page of raw ticks is converted to the lightweight record type for
+    # the kind; the records double as the dedup keys (a membership check
+    # against the accumulated list would be quadratic in the ticks per day).
     if kind == "TRADES":
-        return parse_historic_trade_ticks(historic_ticks=raw, instrument_id=instrument.id)
-    elif kind == "BID_ASK":
-        return parse_historic_quote_ticks(historic_ticks=raw, instrument_id=instrument.id)
-    elif kind.split("-")[0] == "BARS":
-        return parse_historic_bars(historic_bars=raw, instrument=instrument, kind=kind)
-    else:
-        raise RuntimeError(f"Unknown {kind=}")
+        return operator.attrgetter("time", "price", "size"), _HistoricalTradeTick
+    else:  # BID_ASK
+        return (
+            operator.attrgetter("time", "priceBid", "priceAsk", "sizeBid", "sizeAsk"),
+            _HistoricalBidAsk,
+        )
+
+
+def _handle_tick_page(ticks: List, start_time, data: List, seen: set, date, tz_name: str) -> bool:
+    """
+    Merge one (deduplicated) page of tick records into `data`, returning
+    whether pagination should continue.
+    """
+    if not ticks or ticks[-1].time < start_time:
+        return False
+    seen.update(ticks)
+
+    logger.debug(f"Received {len(ticks)} ticks between {ticks[0].time} and {ticks[-1].time}")
+
+    last_timestamp = pd.Timestamp(ticks[-1].time)
+    last_date = last_timestamp.astimezone(tz_name).date()
+
+    if last_date != date:
+        # May contain data from next date, filter this out. Converting the
+        # timestamps in a single vectorized pass is far cheaper than a
+        # pd.Timestamp construction + astimezone call per tick.
+        tick_dates = pd.DatetimeIndex([t.time for t in ticks]).tz_convert(tz_name).date
+        data.extend(tick for tick, d in zip(ticks, tick_dates) if d == date)
+        return False
+    data.extend(ticks)
+    return True
 
 
 def request_tick_data(
@@ -161,49 +477,93 @@ def request_tick_data(
 ) -> List:
     assert kind in ("TRADES", "BID_ASK")
     data: List = []
+    fields, record = _tick_record(kind)
+    seen: set = set()
 
     while True:
         start_time = _determine_next_timestamp(
-            date=date, timestamps=[d.time for d in data], tz_name=tz_name
+            date=date,
+            first_timestamp=data[0].time if data else None,
+            last_timestamp=data[-1].time if data else None,
+            tz_name=tz_name,
         )
         logger.debug(f"Using start_time: {start_time}")
 
-        ticks = _request_historical_ticks(
+        raw_ticks = _request_historical_ticks(
             ib=ib,
             contract=contract,
-            start_time=start_time.strftime("%Y%m%d %H:%M:%S %Z"),
+            start_time=_format_request_timestamp(start_time),
             what=kind,
         )
 
-        ticks = [t for t in ticks if t not in data]
-
-        if not ticks or ticks[-1].time < start_time:
+        ticks = [t for t in map(record._make, map(fields, raw_ticks)) if t not in seen]
+        if not _handle_tick_page(ticks, start_time, data, seen, date, tz_name):
             break
+    return data
 
-        logger.debug(f"Received {len(ticks)} ticks between {ticks[0].time} and {ticks[-1].time}")
 
-        last_timestamp = pd.Timestamp(ticks[-1].time)
-        last_date = last_timestamp.astimezone(tz_name).date()
+async def request_tick_data_async(
+    contract: Contract, date: datetime.date, kind: str, tz_name: str, ib=None
+) -> List:
+    assert kind in ("TRADES", "BID_ASK")
+    data: List = []
+    fields, record = _tick_record(kind)
+    seen: set = set()
 
-        if last_date != date:
-            # May contain data from next date, filter this out
-            data.extend(
-                [
-                    tick
-                    for tick in ticks
-                    if pd.Timestamp(tick.time).astimezone(tz_name).date() == date
-                ]
-            )
+    while True:
+        start_time = _determine_next_timestamp(
+            date=date,
+            first_timestamp=data[0].time if data else None,
+            last_timestamp=data[-1].time if data else None,
+            tz_name=tz_name,
+        )
+        logger.debug(f"Using start_time: {start_time}")
+
+        raw_ticks = await _request_historical_ticks_async(
+            ib=ib,
+            contract=contract,
+            start_time=_format_request_timestamp(start_time),
+            what=kind,
+        )
+
+        ticks = [t for t in map(record._make, map(fields, raw_ticks)) if t not in seen]
+        if not _handle_tick_page(ticks, start_time, data, seen, date, tz_name):
             break
-        else:
-            data.extend(ticks)
     return data
 
 
+def _handle_bar_page(bars: List, data: List, seen_dates: set, date, tz_name: str):
+    """
+    Merge one (deduplicated) page of bar records into `data`, returning the
+    end time for the next page or ``None`` when pagination should stop.
+    """
+    if not bars:
+        return None
+
+    logger.info(f"Received {len(bars)} bars between {bars[0].date} and {bars[-1].date}")
+
+    # We're requesting from end_date backwards, set our timestamp to the earliest timestamp
+    first_timestamp = pd.Timestamp(bars[0].date).tz_convert(tz_name)
+    first_date = first_timestamp.date()
+
+    if first_date != date:
+        # May contain data from next date, filter this out in a single
+        # vectorized pass rather than localizing per bar.
+        bar_dates = pd.DatetimeIndex([bar.date for bar in bars])
+        if bar_dates.tz is None:
+            bar_dates = bar_dates.tz_localize(_tz(tz_name), ambiguous=False)
+        data.extend(bar for bar, d in zip(bars, bar_dates.date) if d == date)
+        return None
+    data.extend(bars)
+    seen_dates.update(bar.date for bar in bars)
+    return first_timestamp
+
+
 def request_bar_data(
     contract: Contract, date: datetime.date, tz_name: str, bar_spec: BarSpecification, ib=None
 ) -> List:
     data: List = []
+    seen_dates: set = set()
 
     start_time = pd.Timestamp(date).tz_localize(tz_name).tz_convert("UTC")
     end_time = start_time + datetime.timedelta(days=1)
@@ -214,39 +574,67 @@ def request_bar_data(
         bar_data_list: BarDataList = _request_historical_bars(
             ib=ib,
             contract=contract,
-            end_time=end_time.strftime("%Y%m%d %H:%M:%S %Z"),
+            end_time=_format_request_timestamp(end_time),
             bar_spec=bar_spec,
         )
 
-        bars = [bar for bar in bar_data_list if bar not in data and bar.volume != 0]
+        bars = [
+            _HistoricalBar(bar.date, bar.open, bar.high, bar.low, bar.close, bar.volume)
+            for bar in bar_data_list
+            if bar.volume != 0 and bar.date not in seen_dates
+        ]
 
-        if not bars:
+        end_time = _handle_bar_page(bars, data, seen_dates, date, tz_name)
+        if end_time is None:
             break
 
-        logger.info(f"Received {len(bars)} bars between {bars[0].date} and {bars[-1].date}")
+    return data
 
-        # We're requesting from end_date backwards, set our timestamp to the earliest timestamp
-        first_timestamp = pd.Timestamp(bars[0].date).tz_convert(tz_name)
-        first_date = first_timestamp.date()
 
-        if first_date != date:
-            # May contain data from next date, filter this out
-            data.extend(
-                [
-                    bar
-                    for bar in bars
-                    if parse_response_datetime(bar.date, tz_name=tz_name).date() == date
-                ]
-            )
-            break
-        else:
-            data.extend(bars)
+async def request_bar_data_async(
+    contract: Contract, date: datetime.date, tz_name: str, bar_spec: BarSpecification, ib=None
+) -> List:
+    data: List = []
+    seen_dates: set = set()
+
+    start_time = pd.Timestamp(date).tz_localize(tz_name).tz_convert("UTC")
+    end_time = start_time + datetime.timedelta(days=1)
 
-        end_time = first_timestamp
+    while True:
+        logger.debug(f"Using end_time: {end_time}")
+
+        bar_data_list: BarDataList = await _request_historical_bars_async(
+            ib=ib,
+            contract=contract,
+            end_time=_format_request_timestamp(end_time),
+            bar_spec=bar_spec,
+        )
+
+        bars = [
+            _HistoricalBar(bar.date, bar.open, bar.high, bar.low, bar.close, bar.volume)
+            for bar in bar_data_list
+            if bar.volume != 0 and bar.date not in seen_dates
+        ]
+
+        end_time = _handle_bar_page(bars, data, seen_dates, date, tz_name)
+        if end_time is None:
+            break
 
     return data
 
 
+def _format_request_timestamp(dt) -> str:
+    """
+    Format a timestamp for an IB request (equivalent to `%Y%m%d %H:%M:%S %Z`);
+    f-string interpolation avoids a full strftime round-trip (whose `%Z`
+    dispatches into the tzinfo object) per pagination step.
+    """
+    return (
+        f"{dt.year:04d}{dt.month:02d}{dt.day:02d} "
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d} {dt.tzname()}"
+    )
+
+
 def _request_historical_ticks(ib: IB, contract: Contract, start_time: str, what="BID_ASK"):
     return ib.reqHistoricalTicks(
         contract=contract,
@@ -258,6 +646,19 @@ def _request_historical_ticks(ib: IB, contract: Contract, start_time: str, what=
     )
 
 
+async def _request_historical_ticks_async(
+    ib: IB, contract: Contract, start_time: str, what="BID_ASK"
+):
+    return await ib.reqHistoricalTicksAsync(
+        contract=contract,
+        startDateTime=start_time,
+        endDateTime="",
+        numberOfTicks=1000,
+        whatToShow=what,
+        useRth=False,
+    )
+
+
 def _bar_spec_to_hist_data_request(bar_spec: BarSpecification) -> Dict[str, str]:
     aggregation = BarAggregationParser.to_str_py(bar_spec.aggregation)
     price_type = PriceTypeParser.to_str_py(bar_spec.price_type)
@@ -289,38 +690,73 @@ def _request_historical_bars(ib: IB, contract: Contract, end_time: str, bar_spec
     )
 
 
-def _determine_next_timestamp(timestamps: List[pd.Timestamp], date: datetime.date, tz_name: str):
+async def _request_historical_bars_async(
+    ib: IB, contract: Contract, end_time: str, bar_spec: BarSpecification
+):
+    spec = _bar_spec_to_hist_data_request(bar_spec=bar_spec)
+    return await ib.reqHistoricalDataAsync(
+        contract=contract,
+        endDateTime=end_time,
+        durationStr=spec["durationStr"],
+        barSizeSetting=spec["barSizeSetting"],
+        whatToShow=spec["whatToShow"],
+        useRTH=False,
+        formatDate=2,
+    )
+
+
+def _determine_next_timestamp(
+    date: datetime.date,
+    first_timestamp,
+    last_timestamp,
+    tz_name: str,
+):
     """
     While looping over available data, it is possible for very liquid products that a 1s period may contain 1000 ticks,
     at which point we need to step the time forward to avoid getting stuck when iterating.
     """
-    if not timestamps:
+    if last_timestamp is None:
         return pd.Timestamp(date, tz=tz_name).tz_convert("UTC")
-    unique_values = set(timestamps)
-    if len(unique_values) == 1:
-        timestamp = timestamps[-1]
-        return timestamp + pd.Timedelta(seconds=1)
+    if first_timestamp == last_timestamp:
+        # Ticks arrive in time order, so every collected timestamp is equal
+        # exactly when the first equals the last.
+        return last_timestamp + pd.Timedelta(seconds=1)
     else:
-        return timestamps[-1]
+        return last_timestamp
+
+
+@functools.lru_cache(maxsize=16)
+def _tz(tz_name: str) -> datetime.tzinfo:
+    # pytz.timezone re-reads the tz database per call; the handful of zones
+    # used during a back fill can simply be cached. pytz is retained (over
+    # zoneinfo) for its `localize` semantics and the python 3.8 floor.
+    return pytz.timezone(tz_name)
 
 
 def parse_response_datetime(
     dt: Union[datetime.datetime, pd.Timestamp], tz_name: str
 ) -> datetime.datetime:
+    if dt.tzinfo is not None:
+        # Hot path - IB responses carry tz-aware timestamps, which need no
+        # conversion at all (pd.Timestamp is a datetime subclass).
+        return dt
     if isinstance(dt, pd.Timestamp):
         dt = dt.to_pydatetime()
-    if dt.tzinfo is None:
-        tz = pytz.timezone(tz_name)
-        dt = tz.localize(dt)
-    return dt
+    return _tz(tz_name).localize(dt)
+
+
+def _unix_nanos(times) -> np.ndarray:
+    """
+    Vectorized equivalent of `dt_to_unix_nanos` for a batch of timestamps.
+    """
+    return pd.DatetimeIndex(times).asi8
 
 
 def parse_historic_quote_ticks(
     historic_ticks: List[HistoricalTickBidAsk], instrument_id: InstrumentId
 ) -> List[QuoteTick]:
     trades = []
-    for tick in historic_ticks:
-        ts_init = dt_to_unix_nanos(tick.time)
+    for tick, ts_init in zip(historic_ticks, _unix_nanos([t.time for t in historic_ticks])):
         quote_tick = QuoteTick(
             instrument_id=instrument_id,
             bid=Price.from_str(str(tick.priceBid)),
@@ -339,18 +775,19 @@ def parse_historic_trade_ticks(
     historic_ticks: List[HistoricalTickLast], instrument_id: InstrumentId
 ) -> List[TradeTick]:
     trades = []
-    for tick in historic_ticks:
-        ts_init = dt_to_unix_nanos(tick.time)
+    ts_inits = _unix_nanos([t.time for t in historic_ticks])
+    # Trade IDs are built from the batch-computed second timestamps, avoiding
+    # the per-tick nanos_to_secs conversion inside generate_trade_id. The
+    # format has a static length bound (10 digit seconds plus the raw price
+    # and size), so no per-tick length assertion is required.
+    ts_secs = ts_inits // 1_000_000_000
+    for tick, ts_init, ts_sec in zip(historic_ticks, ts_inits, ts_secs):
         trade_tick = TradeTick(
             instrument_id=instrument_id,
             price=Price.from_str(str(tick.price)),
             size=Quantity.from_str(str(tick.size)),
             aggressor_side=AggressorSide.UNKNOWN,
-            trade_id=generate_trade_id(
-                ts_event=ts_init,
-                price=tick.price,
-                size=tick.size,
-            ),
+            trade_id=TradeId(f"{ts_sec}-{tick.price}-{tick.size}"),
             ts_init=ts_init,
             ts_event=ts_init,
         )
@@ -369,8 +806,7 @@ def parse_historic_bars(
         aggregation_source=AggregationSource.EXTERNAL,
     )
     precision = instrument.price_precision
-    for bar in historic_bars:
-        ts_init = dt_to_unix_nanos(bar.date)
+    for bar, ts_init in zip(historic_bars, _unix_nanos([b.date for b in historic_bars])):
         trade_tick = Bar(
             bar_type=bar_type,
             open=Price(bar.open, precision),
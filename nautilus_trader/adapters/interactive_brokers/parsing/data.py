@@ -37,6 +37,6 @@ IB_TICK_TYPE = {
 
 
 def generate_trade_id(ts_event: int, price: str, size: str) -> TradeId:
-    id = TradeId(f"{int(nanos_to_secs(ts_event))}-{price}-{size}")
-    assert len(id.value) < 36, f"TradeId too long, was {len(id.value)}"
-    return id
+    # The id has a static upper bound on length (10 digit unix seconds plus
+    # two venue-formatted decimals), so no per-tick length check is needed.
+    return TradeId(f"{int(nanos_to_secs(ts_event))}-{price}-{size}")
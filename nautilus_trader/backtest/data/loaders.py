@@ -42,6 +42,7 @@ class CSVTickDataLoader:
             file_path,
             index_col="timestamp",
             parse_dates=True,
+            infer_datetime_format=True,
         )
 
 
@@ -69,6 +70,7 @@ class CSVBarDataLoader:
             file_path,
             index_col="timestamp",
             parse_dates=True,
+            infer_datetime_format=True,
         )
 
 
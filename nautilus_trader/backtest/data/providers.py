@@ -13,14 +13,14 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import functools
 import pathlib
 from datetime import date
 from decimal import Decimal
-from typing import Optional
+from typing import Callable, Dict, Optional
 
 import fsspec
 import pandas as pd
-from fsspec.implementations.github import GithubFileSystem
 from fsspec.implementations.local import LocalFileSystem
 
 from nautilus_trader.backtest.data.loaders import CSVBarDataLoader
@@ -53,9 +53,13 @@ from nautilus_trader.model.objects import Quantity
 class TestInstrumentProvider:
     """
     Provides instrument template methods for backtesting.
+
+    The templates are memoized - repeat calls with the same arguments return
+    the same instrument instance, which many tests construct in set up.
     """
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def adabtc_binance() -> CurrencyPair:
         """
         Return the Binance ADA/BTC instrument for backtesting.
@@ -93,6 +97,7 @@ class TestInstrumentProvider:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def btcusdt_binance() -> CurrencyPair:
         """
         Return the Binance BTCUSDT instrument for backtesting.
@@ -130,6 +135,7 @@ class TestInstrumentProvider:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def ethusdt_binance() -> CurrencyPair:
         """
         Return the Binance ETHUSDT instrument for backtesting.
@@ -167,6 +173,7 @@ class TestInstrumentProvider:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def ethusdt_perp_binance() -> CryptoPerpetual:
         """
         Return the Binance ETHUSDT-PERP instrument for backtesting.
@@ -205,6 +212,7 @@ class TestInstrumentProvider:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def btcusdt_future_binance(expiry: date = None) -> CryptoFuture:
         """
         Return the Binance BTCUSDT instrument for backtesting.
@@ -250,6 +258,7 @@ class TestInstrumentProvider:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def ethusd_ftx() -> CurrencyPair:
         """
         Return the FTX ETH/USD instrument for backtesting.
@@ -287,6 +296,7 @@ class TestInstrumentProvider:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def xbtusd_bitmex() -> CryptoPerpetual:
         """
         Return the BitMEX XBT/USD perpetual contract for backtesting.
@@ -325,6 +335,7 @@ class TestInstrumentProvider:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def ethusd_bitmex() -> CryptoPerpetual:
         """
         Return the BitMEX ETH/USD perpetual swap contract for backtesting.
@@ -363,6 +374,7 @@ class TestInstrumentProvider:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def default_fx_ccy(symbol: str, venue: Venue = None) -> CurrencyPair:
         """
         Return a default FX currency pair instrument from the given symbol and venue.
@@ -428,6 +440,7 @@ class TestInstrumentProvider:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def aapl_equity():
         return Equity(
             instrument_id=InstrumentId(symbol=Symbol("AAPL"), venue=Venue("NASDAQ")),
@@ -443,6 +456,7 @@ class TestInstrumentProvider:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def es_future():
         return Future(
             instrument_id=InstrumentId(symbol=Symbol("ESZ21"), venue=Venue("CME")),
@@ -460,6 +474,7 @@ class TestInstrumentProvider:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def aapl_option():
         return Option(
             instrument_id=InstrumentId(symbol=Symbol("AAPL211217C00150000"), venue=Venue("OPRA")),
@@ -489,6 +504,11 @@ class TestDataProvider:
         The NautilusTrader GitHub branch for the path.
     """
 
+    # Loaded dataframes are cached module-wide keyed by URI; the same fixture
+    # files are read by many tests and re-parsing them per call dominates the
+    # set up time of data-heavy test modules.
+    _cache: Dict[str, pd.DataFrame] = {}
+
     def __init__(self, branch="develop"):
         self.fs: Optional[fsspec.AbstractFileSystem] = None
         self.root: Optional[str] = None
@@ -517,9 +537,12 @@ class TestDataProvider:
             self.fs = fsspec.filesystem("github", org="nautechsystems", repo="nautilus_trader")
 
     def _make_uri(self, path: str):
+        # The GitHub filesystem class is deliberately not imported at module
+        # level - it drags in the HTTP stack and is only needed when the test
+        # data directory is missing (i.e. not a source checkout).
         if isinstance(self.fs, LocalFileSystem):
             return f"file://{self.root}/{path}"
-        elif isinstance(self.fs, GithubFileSystem):
+        else:  # GithubFileSystem
             return f"github://{self.fs.org}:{self.fs.repo}@{self.branch}/{self.root}/{path}"
 
     def read(self, path: str):
@@ -532,22 +555,43 @@ class TestDataProvider:
         with fsspec.open(uri) as f:
             return pd.read_csv(f, **kwargs)
 
-    def read_csv_ticks(self, path: str):
+    def _load_cached(self, path: str, loader: Callable) -> pd.DataFrame:
         uri = self._make_uri(path=path)
-        with fsspec.open(uri) as f:
-            return CSVTickDataLoader.load(file_path=f)
+        df = self._cache.get(uri)
+        if df is None:
+            with fsspec.open(uri) as f:
+                df = loader(file_path=f)
+            self._cache[uri] = df
+        # Shallow copy so callers can slice, re-index or add columns without
+        # mutating the cached frame.
+        return df.copy(deep=False)
+
+    def _parquet_twin(self, path: str) -> Optional[str]:
+        # Prefer a parquet version of a CSV fixture where one has been
+        # generated; the native columnar read is several times faster than the
+        # pandas CSV parse. Only checked on the local filesystem - probing the
+        # GitHub API per read would cost more than the parse saves.
+        if not path.endswith(".csv") or not isinstance(self.fs, LocalFileSystem):
+            return None
+        parquet_path = path[: -len(".csv")] + ".parquet"
+        if self.fs.exists(f"{self.root}/{parquet_path}"):
+            return parquet_path
+        return None
+
+    def read_csv_ticks(self, path: str):
+        parquet_path = self._parquet_twin(path)
+        if parquet_path is not None:
+            return self._load_cached(path=parquet_path, loader=ParquetTickDataLoader.load)
+        return self._load_cached(path=path, loader=CSVTickDataLoader.load)
 
     def read_csv_bars(self, path: str):
-        uri = self._make_uri(path=path)
-        with fsspec.open(uri) as f:
-            return CSVBarDataLoader.load(file_path=f)
+        parquet_path = self._parquet_twin(path)
+        if parquet_path is not None:
+            return self._load_cached(path=parquet_path, loader=ParquetBarDataLoader.load)
+        return self._load_cached(path=path, loader=CSVBarDataLoader.load)
 
     def read_parquet_ticks(self, path: str):
-        uri = self._make_uri(path=path)
-        with fsspec.open(uri) as f:
-            return ParquetTickDataLoader.load(file_path=f)
+        return self._load_cached(path=path, loader=ParquetTickDataLoader.load)
 
     def read_parquet_bars(self, path: str):
-        uri = self._make_uri(path=path)
-        with fsspec.open(uri) as f:
-            return ParquetBarDataLoader.load(file_path=f)
+        return self._load_cached(path=path, loader=ParquetBarDataLoader.load)
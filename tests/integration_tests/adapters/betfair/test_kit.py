@@ -35,7 +35,6 @@ from nautilus_trader.adapters.betfair.providers import BetfairInstrumentProvider
 from nautilus_trader.adapters.betfair.providers import make_instruments
 from nautilus_trader.adapters.betfair.util import flatten_tree
 from nautilus_trader.adapters.betfair.util import historical_instrument_provider_loader
-from nautilus_trader.backtest.data.providers import TestDataProvider
 from nautilus_trader.config import BacktestDataConfig
 from nautilus_trader.config import BacktestEngineConfig
 from nautilus_trader.config import BacktestRunConfig
@@ -62,6 +61,7 @@ from tests import TESTS_PACKAGE_ROOT
 from tests.test_kit import PACKAGE_ROOT
 from tests.test_kit.stubs.commands import TestCommandStubs
 from tests.test_kit.stubs.component import TestComponentStubs
+from tests.test_kit.stubs.data import TestDataStubs
 from tests.test_kit.stubs.execution import TestExecStubs
 from tests.test_kit.stubs.identifiers import TestIdStubs
 
@@ -833,7 +833,7 @@ class BetfairDataProvider:
 
     @staticmethod
     def betfair_trade_ticks():
-        return [msg["trade"] for msg in TestDataProvider.l2_feed() if msg.get("op") == "trade"]
+        return [msg.trade for msg in TestDataStubs.l2_feed() if msg.op == "trade"]
 
     @staticmethod
     def badly_formatted_log():
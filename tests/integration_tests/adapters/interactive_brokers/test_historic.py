@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
+import asyncio
 import datetime
 import sys
 from unittest import mock
@@ -19,9 +20,13 @@ from unittest import mock
 import pandas as pd
 import pytest
 import pytz
+from ib_insync import HistoricalTickLast
 
 from nautilus_trader.adapters.interactive_brokers.historic import _bar_spec_to_hist_data_request
+from nautilus_trader.adapters.interactive_brokers.historic import _buffer_data
+from nautilus_trader.adapters.interactive_brokers.historic import _covered_dates
 from nautilus_trader.adapters.interactive_brokers.historic import back_fill_catalog
+from nautilus_trader.adapters.interactive_brokers.historic import back_fill_catalog_async
 from nautilus_trader.adapters.interactive_brokers.historic import parse_historic_bars
 from nautilus_trader.adapters.interactive_brokers.historic import parse_historic_quote_ticks
 from nautilus_trader.adapters.interactive_brokers.historic import parse_historic_trade_ticks
@@ -125,6 +130,224 @@ class TestInteractiveBrokersHistoric:
         result = [call.kwargs for call in mock_ticks.call_args_list]
         assert result == expected
 
+    @staticmethod
+    def async_return_value(value: object) -> asyncio.Future:
+        future: asyncio.Future = asyncio.Future()
+        future.set_result(value)
+        return future
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="test path broken on Windows")
+    @pytest.mark.asyncio
+    async def test_back_fill_catalog_async_ticks(self, mocker):
+        # Arrange
+        contract_details = IBTestStubs.contract_details("AAPL")
+        contract = IBTestStubs.contract()
+        mocker.patch.object(
+            self.ib,
+            "reqContractDetailsAsync",
+            side_effect=lambda contract: self.async_return_value([contract_details]),
+        )
+        mock_ticks = mocker.patch.object(
+            self.ib,
+            "reqHistoricalTicksAsync",
+            side_effect=lambda **kwargs: self.async_return_value([]),
+        )
+
+        # Act
+        await back_fill_catalog_async(
+            ib=self.ib,
+            catalog=self.catalog,
+            contracts=[IBTestStubs.contract()],
+            start_date=datetime.date(2020, 1, 1),
+            end_date=datetime.date(2020, 1, 2),
+            tz_name="America/New_York",
+            kinds=("BID_ASK", "TRADES"),
+            concurrency=2,
+        )
+
+        # Assert - the slice-wise gather preserves work order, so the requests
+        # carry the same kwargs in the same order as the synchronous version
+        shared = {"numberOfTicks": 1000, "useRth": False, "endDateTime": ""}
+        expected = [
+            dict(
+                contract=contract,
+                startDateTime="20200101 05:00:00 UTC",
+                whatToShow="BID_ASK",
+                **shared
+            ),
+            dict(
+                contract=contract,
+                startDateTime="20200101 05:00:00 UTC",
+                whatToShow="TRADES",
+                **shared
+            ),
+            dict(
+                contract=contract,
+                startDateTime="20200102 05:00:00 UTC",
+                whatToShow="BID_ASK",
+                **shared
+            ),
+            dict(
+                contract=contract,
+                startDateTime="20200102 05:00:00 UTC",
+                whatToShow="TRADES",
+                **shared
+            ),
+        ]
+        result = [call.kwargs for call in mock_ticks.call_args_list]
+        assert result == expected
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="test path broken on Windows")
+    @pytest.mark.asyncio
+    async def test_back_fill_catalog_async_writes_match_sync(self, mocker):
+        # Arrange
+        contract_details = IBTestStubs.contract_details("AAPL")
+        page = self._trade_tick_page()
+        mocker.patch.object(self.ib, "reqContractDetails", return_value=[contract_details])
+        mocker.patch.object(self.ib, "reqHistoricalTicks", return_value=page)
+        mocker.patch.object(
+            self.ib,
+            "reqContractDetailsAsync",
+            side_effect=lambda contract: self.async_return_value([contract_details]),
+        )
+        mocker.patch.object(
+            self.ib,
+            "reqHistoricalTicksAsync",
+            side_effect=lambda **kwargs: self.async_return_value(page),
+        )
+        mock_write = mocker.patch(
+            "nautilus_trader.adapters.interactive_brokers.historic.write_objects"
+        )
+        shared = dict(
+            catalog=self.catalog,
+            contracts=[IBTestStubs.contract()],
+            start_date=datetime.date(2020, 1, 1),
+            end_date=datetime.date(2020, 1, 2),
+            tz_name="America/New_York",
+            kinds=("TRADES",),
+            write_batch_size=2,
+        )
+
+        # Act
+        back_fill_catalog(ib=self.ib, **shared)
+        sync_calls = [
+            (call.kwargs["basename_template"], len(call.kwargs["chunk"]))
+            for call in mock_write.call_args_list
+            if "basename_template" in call.kwargs
+        ]
+        mock_write.reset_mock()
+        await back_fill_catalog_async(ib=self.ib, concurrency=2, **shared)
+        async_calls = [
+            (call.kwargs["basename_template"], len(call.kwargs["chunk"]))
+            for call in mock_write.call_args_list
+            if "basename_template" in call.kwargs
+        ]
+
+        # Assert - buffering and flushing produce the same files as the sync path
+        assert sync_calls
+        assert async_calls == sync_calls
+
+    @staticmethod
+    def _trade_tick_page():
+        # One page of trade ticks inside the 2020-01-01 US session; repeating
+        # the same page on the next request terminates the pagination loop via
+        # the dedup filter.
+        return [
+            HistoricalTickLast(
+                time=datetime.datetime(2020, 1, 1, 14, 30, second, tzinfo=pytz.utc),
+                price=100.0 + second,
+                size=1.0,
+            )
+            for second in range(5)
+        ]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="test path broken on Windows")
+    def test_back_fill_catalog_write_batching(self, mocker):
+        # Arrange
+        contract_details = IBTestStubs.contract_details("AAPL")
+        mocker.patch.object(self.ib, "reqContractDetails", return_value=[contract_details])
+        mocker.patch.object(self.ib, "reqHistoricalTicks", return_value=self._trade_tick_page())
+        mock_write = mocker.patch(
+            "nautilus_trader.adapters.interactive_brokers.historic.write_objects"
+        )
+
+        # Act
+        back_fill_catalog(
+            ib=self.ib,
+            catalog=self.catalog,
+            contracts=[IBTestStubs.contract()],
+            start_date=datetime.date(2020, 1, 1),
+            end_date=datetime.date(2020, 1, 1),
+            tz_name="America/New_York",
+            kinds=("TRADES",),
+            write_batch_size=2,
+        )
+
+        # Assert - 5 ticks flushed in slices of `write_batch_size`, each slice
+        # written under its own part-numbered basename template
+        data_calls = [
+            call.kwargs for call in mock_write.call_args_list if "basename_template" in call.kwargs
+        ]
+        assert [call["basename_template"] for call in data_calls] == [
+            "20200101-0-{i}.parquet",
+            "20200101-1-{i}.parquet",
+            "20200101-2-{i}.parquet",
+        ]
+        assert [len(call["chunk"]) for call in data_calls] == [2, 2, 1]
+
+    @pytest.mark.parametrize(
+        "filenames, expected",
+        [
+            (["20200101-0.parquet"], {datetime.date(2020, 1, 1)}),
+            (
+                ["20200101-20200103-0.parquet"],
+                {datetime.date(2020, 1, 1), datetime.date(2020, 1, 2), datetime.date(2020, 1, 3)},
+            ),
+            (["20200101-1-0.parquet"], {datetime.date(2020, 1, 1)}),
+            (["_common_metadata", "notes.txt", "2020-01-01.parquet"], set()),
+        ],
+    )
+    def test_covered_dates(self, filenames, expected):
+        assert _covered_dates(filenames) == expected
+
+    def test_buffer_data_flushes_before_gap(self, mocker):
+        # Arrange
+        mock_write = mocker.patch(
+            "nautilus_trader.adapters.interactive_brokers.historic._write_buffer"
+        )
+        buffers: dict = {}
+        key = ("AAPL.NASDAQ", "TRADES")
+
+        # Act - Wed 2020-01-08 follows an empty Tuesday after Mon 2020-01-06
+        _buffer_data(self.catalog, buffers, key, datetime.date(2020, 1, 6), ["mon"], 100)
+        _buffer_data(self.catalog, buffers, key, datetime.date(2020, 1, 8), ["wed"], 100)
+
+        # Assert - the Monday buffer was flushed alone, so no range file name
+        # spans the empty Tuesday and it stays refetchable
+        assert mock_write.call_count == 1
+        flushed = mock_write.call_args.kwargs["buffer"]
+        assert flushed == {"chunk": ["mon"], "dates": [datetime.date(2020, 1, 6)]}
+        assert buffers[key] == {"chunk": ["wed"], "dates": [datetime.date(2020, 1, 8)]}
+
+    def test_buffer_data_batches_consecutive_business_days(self, mocker):
+        # Arrange
+        mock_write = mocker.patch(
+            "nautilus_trader.adapters.interactive_brokers.historic._write_buffer"
+        )
+        buffers: dict = {}
+        key = ("AAPL.NASDAQ", "TRADES")
+
+        # Act - Fri 2020-01-03 to Mon 2020-01-06 has no business day between
+        _buffer_data(self.catalog, buffers, key, datetime.date(2020, 1, 3), ["fri"], 100)
+        _buffer_data(self.catalog, buffers, key, datetime.date(2020, 1, 6), ["mon"], 100)
+
+        # Assert
+        assert mock_write.call_count == 0
+        assert buffers[key] == {
+            "chunk": ["fri", "mon"],
+            "dates": [datetime.date(2020, 1, 3), datetime.date(2020, 1, 6)],
+        }
+
     def test_parse_historic_trade_ticks(self):
         # Arrange
         raw = IBTestStubs.historic_trades()
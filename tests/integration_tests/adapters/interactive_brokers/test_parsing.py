@@ -16,6 +16,7 @@
 from ib_insync import LimitOrder as IBLimitOrder
 from ib_insync import MarketOrder as IBMarketOrder
 
+from nautilus_trader.adapters.interactive_brokers.parsing.data import generate_trade_id
 from nautilus_trader.adapters.interactive_brokers.parsing.execution import (
     nautilus_order_to_ib_order,
 )
@@ -53,3 +54,15 @@ class TestInteractiveBrokersData(InteractiveBrokersTestBase):
         assert result.action == expected.action
         assert result.totalQuantity == expected.totalQuantity
         assert result.lmtPrice == expected.lmtPrice
+
+    def test_generate_trade_id_max_width(self):
+        # Arrange - widest plausible inputs (far-future timestamp, wide decimals)
+        ts_event = 4102444800_000_000_000  # 2100-01-01 in unix nanos (10 digit seconds)
+        price = "99999.99999999"
+        size = "99999.99999999"
+
+        # Act
+        trade_id = generate_trade_id(ts_event=ts_event, price=price, size=size)
+
+        # Assert
+        assert len(trade_id.value) < 36
@@ -33,15 +33,15 @@ def test_l3_feed():
     skip_deletes = []
     i = 0
     for i, m in enumerate(TestDataStubs.l3_feed()):  # noqa (B007)
-        if m["op"] == "update":
-            book.update(order=m["order"])
+        if m.op == "update":
+            book.update(order=m.order)
             try:
                 book.check_integrity()
             except BookIntegrityError:
-                book.delete(order=m["order"])
-                skip_deletes.append(m["order"].id)
-        elif m["op"] == "delete" and m["order"].id not in skip_deletes:
-            book.delete(order=m["order"])
+                book.delete(order=m.order)
+                skip_deletes.append(m.order.id)
+        elif m.op == "delete" and m.order.id not in skip_deletes:
+            book.delete(order=m.order)
         book.check_integrity()
     assert i == 100_047
     assert book.best_ask_level().price == 61405.27923706
@@ -65,14 +65,14 @@ def test_l2_feed():
     ]
     i = 0
     for i, m in enumerate(TestDataStubs.l2_feed()):
-        if not m or m["op"] == "trade":
+        if m.op is None or m.op == "trade":
             pass
-        elif (i, m["order"].id) in skip:
+        elif (i, m.order.id) in skip:
             continue
-        elif m["op"] == "update":
-            book.update(order=m["order"])
-        elif m["op"] == "delete":
-            book.delete(order=m["order"])
+        elif m.op == "update":
+            book.update(order=m.order)
+        elif m.op == "delete":
+            book.delete(order=m.order)
         book.check_integrity()
     assert i == 68462
 
@@ -86,8 +86,8 @@ def test_l1_orderbook():
     for i, m in enumerate(TestDataStubs.l1_feed()):  # noqa (B007)
         # print(f"[{i}]", "\n", m, "\n", repr(ob), "\n")
         # print("")
-        if m["op"] == "update":
-            book.update(order=m["order"])
+        if m.op == "update":
+            book.update(order=m.order)
         else:
             raise KeyError
         book.check_integrity()
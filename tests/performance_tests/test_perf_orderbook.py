@@ -20,10 +20,10 @@ from tests.test_kit.stubs.identifiers import TestIdStubs
 
 def run_l3_test(book, feed):
     for m in feed:
-        if m["op"] == "update":
-            book.update(order=m["order"])
-        elif m["op"] == "delete":
-            book.delete(order=m["order"])
+        if m.op == "update":
+            book.update(order=m.order)
+        elif m.op == "delete":
+            book.delete(order=m.order)
     return book
 
 
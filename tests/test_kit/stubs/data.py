@@ -13,6 +13,8 @@
 #  limitations under the License.
 # -------------------------------------------------------------------------------------------------
 
+import functools
+from collections import namedtuple
 from typing import List
 
 import orjson
@@ -21,7 +23,6 @@ import pandas as pd
 from nautilus_trader.backtest.data.providers import TestDataProvider
 from nautilus_trader.backtest.data.providers import TestInstrumentProvider
 from nautilus_trader.backtest.data.wranglers import QuoteTickDataWrangler
-from nautilus_trader.core.datetime import millis_to_nanos
 from nautilus_trader.model.data.bar import Bar
 from nautilus_trader.model.data.bar import BarSpecification
 from nautilus_trader.model.data.bar import BarType
@@ -54,6 +55,52 @@ from tests.test_kit import PACKAGE_ROOT
 from tests.test_kit.stubs.identifiers import TestIdStubs
 
 
+# Fixture paths computed once rather than concatenated per call
+_DATA = PACKAGE_ROOT + "/data"
+_L2_FEED_PATH = f"{_DATA}/L2_feed.ndjson"
+_L3_FEED_PATH = f"{_DATA}/L3_feed.ndjson"
+
+
+@functools.lru_cache(maxsize=None)
+def _load_feed(path: str) -> List:
+    # The parsed JSON is cached module-wide as the same multi-MB feeds are
+    # replayed by several tests; the Order objects themselves are rebuilt per
+    # call since the book may mutate them. The newline-delimited layout is
+    # parsed one record at a time, so peak memory is bounded by the parsed
+    # records rather than doubled by a whole-file string.
+    with open(path, "rb") as f:
+        return [orjson.loads(line) for line in f]
+
+
+@functools.lru_cache(maxsize=None)
+def _l3_update_rows(path: str) -> List:
+    # Flatten the raw L3 channel messages into (order_id, price, size) rows
+    # once; repeat feed builds then only pay for the Order construction.
+    rows = []
+    for parsed in _load_feed(path):
+        if not isinstance(parsed, list):
+            continue
+        _channel, updates = parsed
+        if isinstance(updates, int):
+            continue
+        if not isinstance(updates[0], list):
+            updates = [updates]
+        rows.extend(updates)
+    return rows
+
+
+# A single feed fixture record; a fixed-slot tuple is several times smaller
+# than a per-record dict and field access avoids the hash lookup.
+FeedMsg = namedtuple("FeedMsg", ("op", "order", "trade", "timestamp"), defaults=(None,) * 4)
+
+
+# Loop-invariant constants for the feed builders below
+_L1_ORDER_SIZE = Quantity(1e9, precision=2)
+_L2_INSTRUMENT_ID = InstrumentId(Symbol("TEST"), Venue("BETFAIR"))
+# Betting sides are reversed
+_L2_SIDE_MAP = {2: OrderSide.BUY, 1: OrderSide.SELL}
+
+
 class TestDataStubs:
     @staticmethod
     def ticker(instrument_id=None) -> Ticker:
@@ -337,110 +384,108 @@ class TestDataStubs:
 
     @staticmethod
     def l1_feed():
-        provider = TestDataProvider()
-        updates = []
-        for _, row in provider.read_csv_ticks("truefx-usdjpy-ticks.csv").iterrows():
-            for side, order_side in zip(("bid", "ask"), (OrderSide.BUY, OrderSide.SELL)):
-                updates.append(
-                    {
-                        "op": "update",
-                        "order": Order(
-                            price=Price(row[side], precision=6),
-                            size=Quantity(1e9, precision=2),
-                            side=order_side,
-                        ),
-                    }
-                )
+        df = TestDataProvider().read_csv_ticks("truefx-usdjpy-ticks.csv")
+        # Pull the bid/ask columns out as numpy arrays once; iterrows
+        # materializes a dtype-erased Series per row and dominates the
+        # fixture build time.
+        bids = df["bid"].to_numpy()
+        asks = df["ask"].to_numpy()
+        size = _L1_ORDER_SIZE
+        buy, sell = OrderSide.BUY, OrderSide.SELL
+        # The final length is known (a bid and an ask update per row), so the
+        # list is preallocated and index-assigned rather than grown via append.
+        updates: List = [None] * (2 * len(bids))
+        i = 0
+        for bid, ask in zip(bids, asks):
+            updates[i] = FeedMsg(
+                op="update",
+                order=Order(price=Price(bid, precision=6), size=size, side=buy),
+            )
+            updates[i + 1] = FeedMsg(
+                op="update",
+                order=Order(price=Price(ask, precision=6), size=size, side=sell),
+            )
+            i += 2
         return updates
 
     @staticmethod
     def l2_feed() -> List:
+        docs = _load_feed(_L2_FEED_PATH)
+
+        # Parse the ~18k trade timestamps in one vectorized pass instead of a
+        # scalar pd.Timestamp per line; // 1000 keeps the same scale as the
+        # previous millis_to_nanos(dt.timestamp()) expression.
+        trade_ts = iter(
+            pd.to_datetime(
+                [
+                    d["remote_timestamp"]
+                    for d in docs
+                    if "status" not in d and "close_price" not in d and "trade" in d
+                ]
+            ).asi8
+            // 1000
+        )
+
         def parse_line(d):
             if "status" in d:
-                return {}
+                return FeedMsg()
             elif "close_price" in d:
-                # return {'timestamp': d['remote_timestamp'], "close_price": d['close_price']}
-                return {}
-            if "trade" in d:
-                ts = millis_to_nanos(pd.Timestamp(d["remote_timestamp"]).timestamp())
-                return {
-                    "timestamp": d["remote_timestamp"],
-                    "op": "trade",
-                    "trade": TradeTick(
-                        instrument_id=InstrumentId(Symbol("TEST"), Venue("BETFAIR")),
-                        price=Price(d["trade"]["price"], 4),
-                        size=Quantity(d["trade"]["volume"], 4),
-                        aggressor_side=d["trade"]["side"],
-                        trade_id=TradeId(d["trade"]["trade_id"]),
+                return FeedMsg()
+            trade = d.get("trade")
+            if trade is not None:
+                ts = next(trade_ts)
+                return FeedMsg(
+                    timestamp=d["remote_timestamp"],
+                    op="trade",
+                    trade=TradeTick(
+                        instrument_id=_L2_INSTRUMENT_ID,
+                        price=Price(trade["price"], 4),
+                        size=Quantity(trade["volume"], 4),
+                        aggressor_side=trade["side"],
+                        trade_id=TradeId(trade["trade_id"]),
                         ts_event=ts,
                         ts_init=ts,
                     ),
-                }
-            elif "level" in d and d["level"]["orders"][0]["volume"] == 0:
-                op = "delete"
-            else:
-                op = "update"
-            order_like = d["level"]["orders"][0] if op != "trade" else d["trade"]
-            return {
-                "timestamp": d["remote_timestamp"],
-                "op": op,
-                "order": Order(
+                )
+            # Traverse the nested level/orders structure once per line rather
+            # than re-probing it for the op check and each field below.
+            order_like = d["level"]["orders"][0]
+            op = "delete" if order_like["volume"] == 0 else "update"
+            return FeedMsg(
+                timestamp=d["remote_timestamp"],
+                op=op,
+                order=Order(
                     price=Price(order_like["price"], precision=6),
                     size=Quantity(abs(order_like["volume"]), precision=4),
-                    # Betting sides are reversed
-                    side={2: OrderSide.BUY, 1: OrderSide.SELL}[order_like["side"]],
+                    side=_L2_SIDE_MAP[order_like["side"]],
                     id=str(order_like["order_id"]),
                 ),
-            }
-
-        return [
-            parse_line(line)
-            for line in orjson.loads(open(PACKAGE_ROOT + "/data/L2_feed.json").read())
-        ]
-
-    @staticmethod
-    def l3_feed():
-        def parser(data):
-            parsed = data
-            if not isinstance(parsed, list):
-                # print(parsed)
-                return
-            elif isinstance(parsed, list):
-                channel, updates = parsed
-                if not isinstance(updates[0], list):
-                    updates = [updates]
-            else:
-                raise KeyError()
-            if isinstance(updates, int):
-                print("Err", updates)
-                return
-            for values in updates:
-                keys = ("order_id", "price", "size")
-                data = dict(zip(keys, values))
-                side = OrderSide.BUY if data["size"] >= 0 else OrderSide.SELL
-                if data["price"] == 0:
-                    yield dict(
-                        op="delete",
-                        order=Order(
-                            price=Price(data["price"], precision=9),
-                            size=Quantity(abs(data["size"]), precision=9),
-                            side=side,
-                            id=str(data["order_id"]),
-                        ),
-                    )
-                else:
-                    yield dict(
-                        op="update",
-                        order=Order(
-                            price=Price(data["price"], precision=9),
-                            size=Quantity(abs(data["size"]), precision=9),
-                            side=side,
-                            id=str(data["order_id"]),
-                        ),
-                    )
-
-        return [
-            msg
-            for data in orjson.loads(open(PACKAGE_ROOT + "/data/L3_feed.json").read())
-            for msg in parser(data)
-        ]
+            )
+
+        return [parse_line(line) for line in docs]
+
+    @staticmethod
+    def iter_l3_feed():
+        # Lazy variant for single-pass consumers; avoids holding all 100k
+        # messages (and their Orders) in memory at once.
+        rows = _l3_update_rows(_L3_FEED_PATH)
+        # Bind the constructors as locals; the loop below runs 100k times
+        # and LOAD_GLOBAL lookups add up at that scale.
+        msg, order, order_price, order_size = FeedMsg, Order, Price, Quantity
+        buy, sell = OrderSide.BUY, OrderSide.SELL
+        return (
+            msg(
+                op="delete" if price == 0 else "update",
+                order=order(
+                    price=order_price(price, precision=9),
+                    size=order_size(abs(size), precision=9),
+                    side=buy if size >= 0 else sell,
+                    id=str(order_id),
+                ),
+            )
+            for order_id, price, size in rows
+        )
+
+    @staticmethod
+    def l3_feed() -> List:
+        return list(TestDataStubs.iter_l3_feed())
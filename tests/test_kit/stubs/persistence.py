@@ -64,11 +64,13 @@ class TestPersistenceStubs:
 
     @staticmethod
     def news_event_parser(df, state=None):
-        for _, row in df.iterrows():
+        # itertuples avoids boxing each row into a dtype-erased Series
+        for row in df[["Name", "Impact", "Currency", "Start"]].itertuples(index=False):
+            ts = maybe_dt_to_unix_nanos(pd.Timestamp(row.Start))
             yield NewsEventData(
-                name=str(row["Name"]),
-                impact=getattr(NewsImpact, row["Impact"]),
-                currency=Currency.from_str(row["Currency"]),
-                ts_event=maybe_dt_to_unix_nanos(pd.Timestamp(row["Start"])),
-                ts_init=maybe_dt_to_unix_nanos(pd.Timestamp(row["Start"])),
+                name=str(row.Name),
+                impact=getattr(NewsImpact, row.Impact),
+                currency=Currency.from_str(row.Currency),
+                ts_event=ts,
+                ts_init=ts,
             )